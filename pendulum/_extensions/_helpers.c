@@ -125,6 +125,11 @@ int _days_in_year(int year)
     return DAYS_PER_N_YEAR;
 }
 
+int _days_in_month(int year, int month)
+{
+    return DAYS_PER_MONTHS[_is_leap(year)][month];
+}
+
 int _day_number(int year, int month, int day)
 {
     month = (month + 9) % 12;
@@ -390,6 +395,31 @@ PyObject *days_in_year(PyObject *self, PyObject *args)
     return ndays;
 }
 
+PyObject *days_in_month(PyObject *self, PyObject *args)
+{
+    PyObject *ndays;
+    int year;
+    int month;
+
+    if (!PyArg_ParseTuple(args, "ii", &year, &month))
+    {
+        PyErr_SetString(
+            PyExc_ValueError, "Invalid parameters");
+        return NULL;
+    }
+
+    if (month < 1 || month > MONTHS_PER_YEAR)
+    {
+        PyErr_SetString(
+            PyExc_ValueError, "month must be in 1..12");
+        return NULL;
+    }
+
+    ndays = PyLong_FromLong(_days_in_month(year, month));
+
+    return ndays;
+}
+
 PyObject *timestamp(PyObject *self, PyObject *args)
 {
     int64_t result;
@@ -877,6 +907,10 @@ static PyMethodDef helpers_methods[] = {
      (PyCFunction)days_in_year,
      METH_VARARGS,
      PyDoc_STR("Returns the number of days in the given year.")},
+    {"days_in_month",
+     (PyCFunction)days_in_month,
+     METH_VARARGS,
+     PyDoc_STR("Returns the number of days in the given month.")},
     {"timestamp",
      (PyCFunction)timestamp,
      METH_VARARGS,
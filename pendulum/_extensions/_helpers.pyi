@@ -4,6 +4,7 @@ from collections import namedtuple
 from datetime import date
 from datetime import datetime
 
+def days_in_month(year: int, month: int) -> int: ...
 def days_in_year(year: int) -> int: ...
 def is_leap(year: int) -> bool: ...
 def is_long_year(year: int) -> bool: ...
@@ -89,6 +89,13 @@ def days_in_year(year: int) -> int:
     return DAYS_PER_N_YEAR
 
 
+def days_in_month(year: int, month: int) -> int:
+    if month < 1 or month > 12:
+        raise ValueError("month must be in 1..12")
+
+    return DAYS_PER_MONTHS[int(is_leap(year))][month]
+
+
 def timestamp(dt: datetime.datetime) -> int:
     year = dt.year
 
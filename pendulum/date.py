@@ -1,8 +1,5 @@
 from __future__ import annotations
 
-import calendar
-import math
-
 from datetime import date
 from datetime import datetime
 from datetime import timedelta
@@ -14,6 +11,7 @@ import pendulum
 
 from pendulum.constants import FRIDAY
 from pendulum.constants import MONDAY
+from pendulum.constants import MONTHS_OFFSETS
 from pendulum.constants import MONTHS_PER_YEAR
 from pendulum.constants import SATURDAY
 from pendulum.constants import SUNDAY
@@ -23,7 +21,10 @@ from pendulum.constants import WEDNESDAY
 from pendulum.constants import YEARS_PER_CENTURY
 from pendulum.constants import YEARS_PER_DECADE
 from pendulum.exceptions import PendulumException
-from pendulum.helpers import add_duration
+from pendulum.helpers import add_months
+from pendulum.helpers import days_in_month
+from pendulum.helpers import is_leap
+from pendulum.helpers import is_long_year
 from pendulum.interval import Interval
 from pendulum.mixins.default import FormattableMixin
 
@@ -61,9 +62,7 @@ class Date(FormattableMixin, date):
         """
         Returns the day of the year (1-366).
         """
-        k = 1 if self.is_leap_year() else 2
-
-        return (275 * self.month) // 9 - k * ((self.month + 9) // 12) + self.day - 30
+        return MONTHS_OFFSETS[int(is_leap(self.year))][self.month] + self.day
 
     @property
     def week_of_year(self) -> int:
@@ -71,11 +70,11 @@ class Date(FormattableMixin, date):
 
     @property
     def days_in_month(self) -> int:
-        return calendar.monthrange(self.year, self.month)[1]
+        return days_in_month(self.year, self.month)
 
     @property
     def week_of_month(self) -> int:
-        first_day_of_month = self.replace(day=1)
+        first_day_of_month = self.__class__(self.year, self.month, 1)
 
         return self.week_of_year - first_day_of_month.week_of_year + 1
 
@@ -85,7 +84,7 @@ class Date(FormattableMixin, date):
 
     @property
     def quarter(self) -> int:
-        return int(math.ceil(self.month / 3))
+        return (self.month + 2) // 3
 
     # String Formatting
 
@@ -106,7 +105,7 @@ class Date(FormattableMixin, date):
         return self.strftime("%b %d, %Y")
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}({self.year}, {self.month}, {self.day})"
+        return f"{type(self).__name__}({self.year}, {self.month}, {self.day})"
 
     # COMPARISONS
 
@@ -117,7 +116,8 @@ class Date(FormattableMixin, date):
         dt1 = self.__class__(dt1.year, dt1.month, dt1.day)
         dt2 = self.__class__(dt2.year, dt2.month, dt2.day)
 
-        if self.diff(dt1).in_seconds() < self.diff(dt2).in_seconds():
+        ordinal = self.toordinal()
+        if abs(dt1.toordinal() - ordinal) < abs(dt2.toordinal() - ordinal):
             return dt1
 
         return dt2
@@ -129,7 +129,8 @@ class Date(FormattableMixin, date):
         dt1 = self.__class__(dt1.year, dt1.month, dt1.day)
         dt2 = self.__class__(dt2.year, dt2.month, dt2.day)
 
-        if self.diff(dt1).in_seconds() > self.diff(dt2).in_seconds():
+        ordinal = self.toordinal()
+        if abs(dt1.toordinal() - ordinal) > abs(dt2.toordinal() - ordinal):
             return dt1
 
         return dt2
@@ -138,19 +139,19 @@ class Date(FormattableMixin, date):
         """
         Determines if the instance is in the future, ie. greater than now.
         """
-        return self > self.today()
+        return self > date.today()
 
     def is_past(self) -> bool:
         """
         Determines if the instance is in the past, ie. less than now.
         """
-        return self < self.today()
+        return self < date.today()
 
     def is_leap_year(self) -> bool:
         """
         Determines if the instance is a leap year.
         """
-        return calendar.isleap(self.year)
+        return is_leap(self.year)
 
     def is_long_year(self) -> bool:
         """
@@ -158,7 +159,7 @@ class Date(FormattableMixin, date):
 
         See link `<https://en.wikipedia.org/wiki/ISO_8601#Week_dates>`_
         """
-        return Date(self.year, 12, 28).isocalendar()[1] == 53
+        return is_long_year(self.year)
 
     def is_same_day(self, dt: date) -> bool:
         """
@@ -173,11 +174,9 @@ class Date(FormattableMixin, date):
         Compares the date/month values of the two dates.
         """
         if dt is None:
-            dt = Date.today()
-
-        instance = self.__class__(dt.year, dt.month, dt.day)
+            dt = date.today()
 
-        return (self.month, self.day) == (instance.month, instance.day)
+        return (self.month, self.day) == (dt.month, dt.day)
 
     # the additional method for checking if today is the anniversary day
     # the alias is provided to start using a new name and keep the backward compatibility
@@ -197,13 +196,15 @@ class Date(FormattableMixin, date):
         :param weeks: The number of weeks
         :param days: The number of days
         """
-        dt = add_duration(
-            date(self.year, self.month, self.day),
-            years=years,
-            months=months,
-            weeks=weeks,
-            days=days,
-        )
+        if not years and not months:
+            dt = date(self.year, self.month, self.day) + timedelta(
+                days=days + weeks * 7
+            )
+
+            return self.__class__(dt.year, dt.month, dt.day)
+
+        dt = date(*add_months(self.year, self.month, self.day, years * 12 + months))
+        dt += timedelta(days=days + weeks * 7)
 
         return self.__class__(dt.year, dt.month, dt.day)
 
@@ -218,6 +219,13 @@ class Date(FormattableMixin, date):
         :param weeks: The number of weeks
         :param days: The number of days
         """
+        if not years and not months:
+            dt = date(self.year, self.month, self.day) - timedelta(
+                days=days + weeks * 7
+            )
+
+            return self.__class__(dt.year, dt.month, dt.day)
+
         return self.add(years=-years, months=-months, weeks=-weeks, days=-days)
 
     def _add_timedelta(self, delta: timedelta) -> Date:
@@ -234,7 +242,9 @@ class Date(FormattableMixin, date):
                 days=delta.remaining_days,
             )
 
-        return self.add(days=delta.days)
+        dt = date(self.year, self.month, self.day) + delta
+
+        return self.__class__(dt.year, dt.month, dt.day)
 
     def _subtract_timedelta(self, delta: timedelta) -> Date:
         """
@@ -250,7 +260,9 @@ class Date(FormattableMixin, date):
                 days=delta.remaining_days,
             )
 
-        return self.subtract(days=delta.days)
+        dt = date(self.year, self.month, self.day) - delta
+
+        return self.__class__(dt.year, dt.month, dt.day)
 
     def __add__(self, other: timedelta) -> Date:
         if not isinstance(other, timedelta):
@@ -388,25 +400,25 @@ class Date(FormattableMixin, date):
         """
         Reset the date to the first day of the month.
         """
-        return self.set(self.year, self.month, 1)
+        return self.__class__(self.year, self.month, 1)
 
     def _end_of_month(self) -> Date:
         """
         Reset the date to the last day of the month.
         """
-        return self.set(self.year, self.month, self.days_in_month)
+        return self.__class__(self.year, self.month, self.days_in_month)
 
     def _start_of_year(self) -> Date:
         """
         Reset the date to the first day of the year.
         """
-        return self.set(self.year, 1, 1)
+        return self.__class__(self.year, 1, 1)
 
     def _end_of_year(self) -> Date:
         """
         Reset the date to the last day of the year.
         """
-        return self.set(self.year, 12, 31)
+        return self.__class__(self.year, 12, 31)
 
     def _start_of_decade(self) -> Date:
         """
@@ -414,7 +426,7 @@ class Date(FormattableMixin, date):
         """
         year = self.year - self.year % YEARS_PER_DECADE
 
-        return self.set(year, 1, 1)
+        return self.__class__(year, 1, 1)
 
     def _end_of_decade(self) -> Date:
         """
@@ -422,7 +434,7 @@ class Date(FormattableMixin, date):
         """
         year = self.year - self.year % YEARS_PER_DECADE + YEARS_PER_DECADE - 1
 
-        return self.set(year, 12, 31)
+        return self.__class__(year, 12, 31)
 
     def _start_of_century(self) -> Date:
         """
@@ -430,7 +442,7 @@ class Date(FormattableMixin, date):
         """
         year = self.year - 1 - (self.year - 1) % YEARS_PER_CENTURY + 1
 
-        return self.set(year, 1, 1)
+        return self.__class__(year, 1, 1)
 
     def _end_of_century(self) -> Date:
         """
@@ -438,29 +450,19 @@ class Date(FormattableMixin, date):
         """
         year = self.year - 1 - (self.year - 1) % YEARS_PER_CENTURY + YEARS_PER_CENTURY
 
-        return self.set(year, 12, 31)
+        return self.__class__(year, 12, 31)
 
     def _start_of_week(self) -> Date:
         """
         Reset the date to the first day of the week.
         """
-        dt = self
-
-        if self.day_of_week != pendulum._WEEK_STARTS_AT:
-            dt = self.previous(pendulum._WEEK_STARTS_AT)
-
-        return dt.start_of("day")
+        return self.subtract(days=(self.day_of_week - pendulum._WEEK_STARTS_AT) % 7)
 
     def _end_of_week(self) -> Date:
         """
         Reset the date to the last day of the week.
         """
-        dt = self
-
-        if self.day_of_week != pendulum._WEEK_ENDS_AT:
-            dt = self.next(pendulum._WEEK_ENDS_AT)
-
-        return dt.end_of("day")
+        return self.add(days=(pendulum._WEEK_ENDS_AT - self.day_of_week) % 7)
 
     def next(self, day_of_week: int | None = None) -> Date:
         """
@@ -477,11 +479,7 @@ class Date(FormattableMixin, date):
         if day_of_week < SUNDAY or day_of_week > SATURDAY:
             raise ValueError("Invalid day of week")
 
-        dt = self.add(days=1)
-        while dt.day_of_week != day_of_week:
-            dt = dt.add(days=1)
-
-        return dt
+        return self.add(days=(day_of_week - self.day_of_week - 1) % 7 + 1)
 
     def previous(self, day_of_week: int | None = None) -> Date:
         """
@@ -498,11 +496,7 @@ class Date(FormattableMixin, date):
         if day_of_week < SUNDAY or day_of_week > SATURDAY:
             raise ValueError("Invalid day of week")
 
-        dt = self.subtract(days=1)
-        while dt.day_of_week != day_of_week:
-            dt = dt.subtract(days=1)
-
-        return dt
+        return self.subtract(days=(self.day_of_week - day_of_week - 1) % 7 + 1)
 
     def first_of(self, unit: str, day_of_week: int | None = None) -> Date:
         """
@@ -576,18 +570,11 @@ class Date(FormattableMixin, date):
         dt = self
 
         if day_of_week is None:
-            return dt.set(day=1)
+            return dt.__class__(dt.year, dt.month, 1)
 
-        month = calendar.monthcalendar(dt.year, dt.month)
+        day_of_month = (day_of_week - dt.day_of_week + dt.day - 1) % 7 + 1
 
-        calendar_day = (day_of_week - 1) % 7
-
-        if month[0][calendar_day] > 0:
-            day_of_month = month[0][calendar_day]
-        else:
-            day_of_month = month[1][calendar_day]
-
-        return dt.set(day=day_of_month)
+        return dt.__class__(dt.year, dt.month, day_of_month)
 
     def _last_of_month(self, day_of_week: int | None = None) -> Date:
         """
@@ -601,18 +588,12 @@ class Date(FormattableMixin, date):
         dt = self
 
         if day_of_week is None:
-            return dt.set(day=self.days_in_month)
-
-        month = calendar.monthcalendar(dt.year, dt.month)
+            return dt.__class__(dt.year, dt.month, self.days_in_month)
 
-        calendar_day = (day_of_week - 1) % 7
+        last_day = self.days_in_month
+        day_of_month = last_day - (dt.day_of_week + last_day - dt.day - day_of_week) % 7
 
-        if month[-1][calendar_day] > 0:
-            day_of_month = month[-1][calendar_day]
-        else:
-            day_of_month = month[-2][calendar_day]
-
-        return dt.set(day=day_of_month)
+        return dt.__class__(dt.year, dt.month, day_of_month)
 
     def _nth_of_month(self, nth: int, day_of_week: int) -> Date | None:
         """
@@ -626,12 +607,12 @@ class Date(FormattableMixin, date):
             return self.first_of("month", day_of_week)
 
         dt = self.first_of("month")
-        check = dt.format("YYYY-MM")
+        check = (dt.year, dt.month)
         for _ in range(nth - (1 if dt.day_of_week == day_of_week else 0)):
             dt = dt.next(day_of_week)
 
-        if dt.format("YYYY-MM") == check:
-            return self.set(day=dt.day)
+        if (dt.year, dt.month) == check:
+            return self.__class__(self.year, self.month, dt.day)
 
         return None
 
@@ -642,7 +623,7 @@ class Date(FormattableMixin, date):
         modify to the first day of the quarter. Use the supplied consts
         to indicate the desired day_of_week, ex. pendulum.MONDAY.
         """
-        return self.set(self.year, self.quarter * 3 - 2, 1).first_of(
+        return self.__class__(self.year, self.quarter * 3 - 2, 1).first_of(
             "month", day_of_week
         )
 
@@ -653,7 +634,9 @@ class Date(FormattableMixin, date):
         modify to the last day of the quarter. Use the supplied consts
         to indicate the desired day_of_week, ex. pendulum.MONDAY.
         """
-        return self.set(self.year, self.quarter * 3, 1).last_of("month", day_of_week)
+        return self.__class__(self.year, self.quarter * 3, 1).last_of(
+            "month", day_of_week
+        )
 
     def _nth_of_quarter(self, nth: int, day_of_week: int) -> Date | None:
         """
@@ -666,7 +649,7 @@ class Date(FormattableMixin, date):
         if nth == 1:
             return self.first_of("quarter", day_of_week)
 
-        dt = self.replace(self.year, self.quarter * 3, 1)
+        dt = self.__class__(self.year, self.quarter * 3, 1)
         last_month = dt.month
         year = dt.year
         dt = dt.first_of("quarter")
@@ -676,7 +659,7 @@ class Date(FormattableMixin, date):
         if last_month < dt.month or year != dt.year:
             return None
 
-        return self.set(self.year, dt.month, dt.day)
+        return self.__class__(self.year, dt.month, dt.day)
 
     def _first_of_year(self, day_of_week: int | None = None) -> Date:
         """
@@ -685,7 +668,7 @@ class Date(FormattableMixin, date):
         modify to the first day of the year. Use the supplied consts
         to indicate the desired day_of_week, ex. pendulum.MONDAY.
         """
-        return self.set(month=1).first_of("month", day_of_week)
+        return self.__class__(self.year, 1, self.day).first_of("month", day_of_week)
 
     def _last_of_year(self, day_of_week: int | None = None) -> Date:
         """
@@ -694,7 +677,9 @@ class Date(FormattableMixin, date):
         modify to the last day of the year. Use the supplied consts
         to indicate the desired day_of_week, ex. pendulum.MONDAY.
         """
-        return self.set(month=MONTHS_PER_YEAR).last_of("month", day_of_week)
+        return self.__class__(self.year, MONTHS_PER_YEAR, self.day).last_of(
+            "month", day_of_week
+        )
 
     def _nth_of_year(self, nth: int, day_of_week: int) -> Date | None:
         """
@@ -715,7 +700,7 @@ class Date(FormattableMixin, date):
         if year != dt.year:
             return None
 
-        return self.set(self.year, dt.month, dt.day)
+        return self.__class__(self.year, dt.month, dt.day)
 
     def average(self, dt: date | None = None) -> Date:
         """
@@ -723,9 +708,17 @@ class Date(FormattableMixin, date):
         of a given instance (default now) and the current instance.
         """
         if dt is None:
-            dt = Date.today()
+            dt = date.today()
+
+        # Halve the distance towards zero so that the average
+        # of an odd span is always rounded towards the instance.
+        days = dt.toordinal() - self.toordinal()
+        if days < 0:
+            days = -(-days // 2)
+        else:
+            days //= 2
 
-        return self.add(days=int(self.diff(dt, False).in_days() / 2))
+        return self.add(days=days)
 
     # Native methods override
 
@@ -753,6 +746,9 @@ class Date(FormattableMixin, date):
         month: int | None = None,
         day: int | None = None,
     ) -> Date:
+        if year is None and month is None and day is None:
+            return self
+
         year = year if year is not None else self.year
         month = month if month is not None else self.month
         day = day if day is not None else self.day
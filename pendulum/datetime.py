@@ -548,7 +548,7 @@ class DateTime(datetime.datetime, Date):
         move forward from current time, otherwise move forward from utc, for accuracy
         when moving across DST boundaries.
         """
-        units_of_variable_length = any([years, months, weeks, days])
+        units_of_variable_length = bool(years or months or weeks or days)
 
         current_dt = datetime.datetime(
             self.year,
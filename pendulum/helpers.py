@@ -13,7 +13,6 @@ from typing import overload
 
 import pendulum
 
-from pendulum.constants import DAYS_PER_MONTHS
 from pendulum.formatting.difference_formatter import DifferenceFormatter
 from pendulum.locales.locale import Locale
 
@@ -32,6 +31,7 @@ try:
         raise ImportError()
 
     from pendulum._extensions._helpers import PreciseDiff
+    from pendulum._extensions._helpers import days_in_month
     from pendulum._extensions._helpers import days_in_year
     from pendulum._extensions._helpers import is_leap
     from pendulum._extensions._helpers import is_long_year
@@ -41,6 +41,7 @@ try:
     from pendulum._extensions._helpers import week_day
 except ImportError:
     from pendulum._extensions.helpers import PreciseDiff  # type: ignore[misc]
+    from pendulum._extensions.helpers import days_in_month
     from pendulum._extensions.helpers import days_in_year
     from pendulum._extensions.helpers import is_leap
     from pendulum._extensions.helpers import is_long_year
@@ -97,7 +98,7 @@ def add_duration(
     if (
         isinstance(dt, date)
         and not isinstance(dt, datetime)
-        and any([hours, minutes, seconds, microseconds])
+        and (hours or minutes or seconds or microseconds)
     ):
         raise RuntimeError("Time elements cannot be added to a date instance.")
 
@@ -126,27 +127,10 @@ def add_duration(
         hours = mod * s
         days += div * s
 
-    if abs(months) > 11:
-        s = _sign(months)
-        div, mod = divmod(months * s, 12)
-        months = mod * s
-        years += div * s
+    if years or months:
+        year, month, day = add_months(dt.year, dt.month, dt.day, years * 12 + months)
 
-    year = dt.year + years
-    month = dt.month
-
-    if months:
-        month += months
-        if month > 12:
-            year += 1
-            month -= 12
-        elif month < 1:
-            year -= 1
-            month += 12
-
-    day = min(DAYS_PER_MONTHS[int(is_leap(year))][month], dt.day)
-
-    dt = dt.replace(year=year, month=month, day=day)
+        dt = dt.replace(year=year, month=month, day=day)
 
     return dt + timedelta(
         days=days,
@@ -157,6 +141,18 @@ def add_duration(
     )
 
 
+def add_months(year: int, month: int, day: int, months: int) -> tuple[int, int, int]:
+    """
+    Adds a number of months to a year/month/day triple.
+
+    The day is clamped to the last day of the resulting month.
+    """
+    year, month = divmod(year * 12 + month - 1 + months, 12)
+    month += 1
+
+    return year, month, min(day, days_in_month(year, month))
+
+
 def format_diff(
     diff: Duration,
     is_now: bool = True,
@@ -206,6 +202,7 @@ def week_ends_at(wday: int) -> None:
 
 __all__ = [
     "PreciseDiff",
+    "days_in_month",
     "days_in_year",
     "is_leap",
     "is_long_year",
@@ -214,6 +211,7 @@ __all__ = [
     "timestamp",
     "week_day",
     "add_duration",
+    "add_months",
     "format_diff",
     "locale",
     "set_locale",
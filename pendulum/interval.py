@@ -308,6 +308,19 @@ class Interval(Duration):
 
         start, end = self.start, self.end
 
+        if unit in ["days", "weeks"] and amount > 0 and not isinstance(start, datetime):
+            # Dates have no time or timezone to take into account
+            # so we can step through their ordinals directly.
+            step = amount * 7 if unit == "weeks" else amount
+            stop = end.toordinal() + 1
+            if method == "subtract":
+                step, stop = -step, stop - 2
+
+            for ordinal in range(start.toordinal(), stop, step):
+                yield cast(pendulum.Date, start.fromordinal(ordinal))
+
+            return
+
         i = amount
         while op(start, end):
             yield cast(Union[pendulum.DateTime, pendulum.Date], start)
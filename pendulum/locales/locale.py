@@ -31,22 +31,30 @@ class Locale:
         if isinstance(locale, Locale):
             return locale
 
-        locale = cls.normalize_locale(locale)
         if locale in cls._cache:
             return cls._cache[locale]
 
-        # Checking locale existence
-        actual_locale = locale
-        locale_path = cast(Path, resources.files(__package__).joinpath(actual_locale))
-        while not locale_path.exists():
-            if actual_locale == locale:
-                raise ValueError(f"Locale [{locale}] does not exist.")
+        name = locale
+        locale = cls.normalize_locale(locale)
+        if locale not in cls._cache:
+            # Checking locale existence
+            actual_locale = locale
+            locale_path = cast(
+                Path, resources.files(__package__).joinpath(actual_locale)
+            )
+            while not locale_path.exists():
+                if actual_locale == locale:
+                    raise ValueError(f"Locale [{locale}] does not exist.")
+
+                actual_locale = actual_locale.split("_")[0]
 
-            actual_locale = actual_locale.split("_")[0]
+            m = import_module(f"pendulum.locales.{actual_locale}.locale")
 
-        m = import_module(f"pendulum.locales.{actual_locale}.locale")
+            cls._cache[locale] = cls(locale, m.locale)
 
-        cls._cache[locale] = cls(locale, m.locale)
+        # Also cache the locale under the name it was requested with
+        # so that subsequent lookups skip the normalization.
+        cls._cache[name] = cls._cache[locale]
 
         return cls._cache[locale]
 
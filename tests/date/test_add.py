@@ -37,6 +37,12 @@ def test_add_month_with_overflow():
     assert pendulum.Date(2012, 1, 31).add(months=1).month == 2
 
 
+def test_add_months_clamps_to_end_of_month():
+    assert_date(pendulum.Date(2012, 1, 31).add(months=1), 2012, 2, 29)
+    assert_date(pendulum.Date(2012, 3, 31).add(months=-13), 2011, 2, 28)
+    assert_date(pendulum.Date(2012, 2, 29).add(years=1, months=12), 2014, 2, 28)
+
+
 def test_add_days_positive():
     assert pendulum.Date(1975, 5, 31).add(days=1).day == 1
 
@@ -61,6 +67,10 @@ def test_add_weeks_negative():
     assert pendulum.Date(1975, 5, 21).add(weeks=-1).day == 14
 
 
+def test_add_weeks_and_days():
+    assert_date(pendulum.Date(1975, 5, 21).add(weeks=1, days=4), 1975, 6, 1)
+
+
 def test_add_timedelta():
     delta = timedelta(days=18)
     d = pendulum.date(2015, 3, 14)
@@ -38,6 +38,16 @@ def test_end_of_week_crossing_year_boundary():
     assert_date(d, 2014, 1, 5)
 
 
+def test_start_and_end_of_week_with_custom_week_start():
+    pendulum.week_starts_at(pendulum.SUNDAY)
+    pendulum.week_ends_at(pendulum.SATURDAY)
+
+    assert_date(pendulum.date(1980, 8, 7).start_of("week"), 1980, 8, 3)
+    assert_date(pendulum.date(1980, 8, 3).start_of("week"), 1980, 8, 3)
+    assert_date(pendulum.date(1980, 8, 7).end_of("week"), 1980, 8, 9)
+    assert_date(pendulum.date(1980, 8, 9).end_of("week"), 1980, 8, 9)
+
+
 def test_next():
     d = pendulum.date(1975, 5, 21).next()
     assert_date(d, 1975, 5, 28)
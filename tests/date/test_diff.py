@@ -356,6 +356,18 @@ def test_diff_for_humans_absolute_years(today):
     assert today.diff_for_humans(today.add(years=1), True) == "1 year"
 
 
+def test_diff_for_humans_follows_locale_changes():
+    d = pendulum.date(2016, 7, 5)
+
+    assert d.diff_for_humans(d.add(weeks=2), True) == "2 weeks"
+
+    pendulum.set_locale("fr")
+    assert d.diff_for_humans(d.add(weeks=2), True) == "2 semaines"
+
+    pendulum.set_locale("en")
+    assert d.diff_for_humans(d.add(weeks=2), True) == "2 weeks"
+
+
 def test_subtraction():
     d = pendulum.date(2016, 7, 5)
     future_dt = date(2016, 7, 6)
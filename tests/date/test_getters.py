@@ -23,16 +23,34 @@ def test_day_of_week():
     assert d.day_of_week == pendulum.MONDAY
 
 
+def test_day_of_week_century_boundaries():
+    assert pendulum.Date(1, 1, 1).day_of_week == pendulum.MONDAY
+    assert pendulum.Date(1900, 3, 1).day_of_week == pendulum.THURSDAY
+    assert pendulum.Date(2000, 2, 29).day_of_week == pendulum.TUESDAY
+    assert pendulum.Date(2100, 1, 3).day_of_week == pendulum.SUNDAY
+
+
 def test_day_of_year():
     d = pendulum.Date(2015, 12, 31)
     assert d.day_of_year == 365
     d = pendulum.Date(2016, 12, 31)
     assert d.day_of_year == 366
+    d = pendulum.Date(2016, 3, 1)
+    assert d.day_of_year == 61
 
 
 def test_days_in_month():
     d = pendulum.Date(2012, 5, 7)
     assert d.days_in_month == 31
+    assert pendulum.Date(2012, 2, 1).days_in_month == 29
+    assert pendulum.Date(1900, 2, 1).days_in_month == 28
+
+
+def test_quarter():
+    assert pendulum.Date(2012, 1, 31).quarter == 1
+    assert pendulum.Date(2012, 3, 31).quarter == 1
+    assert pendulum.Date(2012, 4, 1).quarter == 2
+    assert pendulum.Date(2012, 12, 31).quarter == 4
 
 
 def test_age():
@@ -238,6 +238,15 @@ def test_average_from_lower():
     assert_date(d2, 2004, 12, 31)
 
 
+def test_average_of_odd_span_rounds_towards_instance():
+    assert_date(
+        pendulum.date(2000, 1, 4).average(pendulum.date(2000, 1, 1)), 2000, 1, 3
+    )
+    assert_date(
+        pendulum.date(2000, 1, 1).average(pendulum.date(2000, 1, 4)), 2000, 1, 2
+    )
+
+
 def test_start_of():
     d = pendulum.date(2013, 3, 31)
 
@@ -63,6 +63,10 @@ def test_subtract_weeks_negative():
     assert pendulum.Date(1975, 5, 14).subtract(weeks=-1).day == 21
 
 
+def test_subtract_weeks_and_days():
+    assert_date(pendulum.Date(1975, 6, 1).subtract(weeks=1, days=4), 1975, 5, 21)
+
+
 def test_subtract_timedelta():
     delta = timedelta(days=18)
     d = pendulum.date(2015, 3, 14)
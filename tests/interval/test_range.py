@@ -3,6 +3,7 @@ from __future__ import annotations
 import pendulum
 
 from pendulum.interval import Interval
+from tests.conftest import assert_date
 from tests.conftest import assert_datetime
 
 
@@ -117,3 +118,22 @@ def test_range_amount():
     assert_datetime(r[1], 2016, 10, 16, 1, 0, 0)
     assert_datetime(r[2], 2016, 10, 18, 0, 0, 0)
     assert_datetime(r[3], 2016, 10, 20, 0, 0, 0)
+
+
+def test_range_dates():
+    p = pendulum.interval(pendulum.date(2000, 1, 1), pendulum.date(2000, 1, 31))
+    r = list(p.range("days"))
+
+    assert len(r) == 31
+    assert all(isinstance(d, pendulum.Date) for d in r)
+    assert_date(r[0], 2000, 1, 1)
+    assert_date(r[-1], 2000, 1, 31)
+
+
+def test_range_dates_inverted_weeks():
+    p = pendulum.interval(pendulum.date(2000, 1, 31), pendulum.date(2000, 1, 1))
+    r = list(p.range("weeks"))
+
+    assert len(r) == 5
+    assert_date(r[0], 2000, 1, 31)
+    assert_date(r[-1], 2000, 1, 3)
@@ -8,6 +8,8 @@ import pytz
 import pendulum
 
 from pendulum import timezone
+from pendulum.helpers import add_months
+from pendulum.helpers import days_in_month
 from pendulum.helpers import days_in_year
 from pendulum.helpers import precise_diff
 from pendulum.helpers import week_day
@@ -123,6 +125,23 @@ def test_days_in_years():
     assert days_in_year(2016) == 366
 
 
+def test_days_in_month():
+    assert days_in_month(2017, 2) == 28
+    assert days_in_month(2016, 2) == 29
+    assert days_in_month(1900, 2) == 28
+    assert days_in_month(2016, 12) == 31
+
+    with pytest.raises(ValueError):
+        days_in_month(2016, 13)
+
+
+def test_add_months():
+    assert add_months(2016, 1, 31, 1) == (2016, 2, 29)
+    assert add_months(2016, 1, 31, -1) == (2015, 12, 31)
+    assert add_months(2016, 3, 31, -25) == (2014, 2, 28)
+    assert add_months(2016, 12, 15, 13) == (2018, 1, 15)
+
+
 def test_locale():
     dt = pendulum.datetime(2000, 11, 10, 12, 34, 56, 123456)
     pendulum.set_locale("fr")